@@ -26,6 +26,9 @@ class ComponentTracker:
         self.last_ltp = {}
         self.prev_ltp = {}
         self.symbols = list(self.COMPONENTS.keys())
+        # Aligned weight vector so scoring is one dot product
+        self._weights = np.array(list(self.COMPONENTS.values()))
+        self._total_weight = float(self._weights.sum())
         
     def fetch_live_data(self) -> Dict[str, float]:
         """Fetches latest prices for components."""
@@ -70,27 +73,17 @@ class ComponentTracker:
         if not self.last_ltp or not self.prev_ltp:
             return {"score": 0.0, "status": "NEUTRAL", "convergence": 0.0}
             
-        score = 0.0
-        details = {}
-        up_count = 0
-        
-        for symbol, weight in self.COMPONENTS.items():
-            curr = self.last_ltp.get(symbol, 0)
-            prev = self.prev_ltp.get(symbol, 0)
-            
-            direction = 0
-            if curr > prev:
-                direction = 1
-                up_count += 1
-            elif curr < prev:
-                direction = -1
-                
-            score += (direction * weight)
-            details[symbol] = direction
-            
+        # Vectorized: sign of the aligned price deltas, one dot product
+        curr = np.array([self.last_ltp.get(s, 0) for s in self.symbols], dtype=np.float64)
+        prev = np.array([self.prev_ltp.get(s, 0) for s in self.symbols], dtype=np.float64)
+        directions = np.sign(curr - prev).astype(np.int64)
+
+        score = float(directions @ self._weights)
+        up_count = int((directions > 0).sum())
+        details = dict(zip(self.symbols, directions.tolist()))
+
         # Normalize score (since sum of weights is ~0.62)
-        total_weight = sum(self.COMPONENTS.values())
-        normalized_score = score / total_weight
+        normalized_score = score / self._total_weight
         
         status = "NEUTRAL"
         if normalized_score >= 0.5: status = "STRONG_BULLISH"
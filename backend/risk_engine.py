@@ -1,4 +1,5 @@
 from typing import Dict, Optional
+import numpy as np
 from notifier import notifier
 from kill_switch import KillSwitch
 
@@ -18,27 +19,58 @@ class RiskEngine:
         """
         Validates if an order complies with risk rules.
         """
+        return self.validate_order_values(
+            order_details.get("quantity", 0), order_details.get("price", 0)
+        )
+
+    def validate_order_values(self, quantity: float, price: float) -> Dict:
+        """
+        Fast-path validation for callers that already hold quantity/price.
+        """
         if self.circuit_breaker_active:
             return {"allowed": False, "reason": "Circuit breaker is ACTIVE. Trading halted."}
-            
+
         if self.kill_switch.is_active():
              return {"allowed": False, "reason": "KILL SWITCH ACTIVE. ALL TRADING STOPPED."}
 
         if self.current_daily_loss >= self.daily_loss_limit:
             return {"allowed": False, "reason": "Daily loss limit reached."}
 
-        order_value = order_details.get("quantity", 0) * order_details.get("price", 0)
+        order_value = quantity * price
         if order_value > self.max_position_size:
             return {"allowed": False, "reason": f"Order value ({order_value}) exceeds max position size."}
 
         return {"allowed": True, "reason": "Safe to proceed."}
 
+    def validate_orders_batch(self, quantities: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        """
+        Vectorized validation for bulk historical replay.
+        Returns a boolean mask of allowed orders.
+        """
+        quantities = np.asarray(quantities)
+        if (self.circuit_breaker_active or self.kill_switch.is_active()
+                or self.current_daily_loss >= self.daily_loss_limit):
+            return np.zeros(len(quantities), dtype=bool)
+
+        return quantities * np.asarray(prices) <= self.max_position_size
+
     def update_pnl(self, realized_pnl: float):
         """
         Updates the daily PnL and checks if the loss limit is breached.
         """
-        self.current_daily_loss += -realized_pnl if realized_pnl < 0 else 0
-        if self.current_daily_loss >= self.daily_loss_limit:
+        self.current_daily_loss += max(0.0, -realized_pnl)
+        self._check_loss_limit()
+
+    def update_pnl_batch(self, pnls: np.ndarray):
+        """
+        Folds a whole PnL stream (e.g. a day of backtest fills) into the
+        daily loss in one vectorized pass.
+        """
+        self.current_daily_loss += float(np.clip(-np.asarray(pnls), 0, None).sum())
+        self._check_loss_limit()
+
+    def _check_loss_limit(self):
+        if not self.circuit_breaker_active and self.current_daily_loss >= self.daily_loss_limit:
             self.circuit_breaker_active = True
             notifier.notify_sync(f"🚫 *RISK BREACH*: Daily Loss Limit Reached (₹{self.current_daily_loss:.2f}). Trading Halted.")
 
@@ -2,13 +2,39 @@ import gymnasium as gym
 from gymnasium import spaces
 import pandas as pd
 import numpy as np
+from numba import njit
 from stable_baselines3 import PPO
+from stable_baselines3.common.vec_env import SubprocVecEnv
 import logging
 import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("RLTradingAgent")
 
+
+@njit(cache=True)
+def _step_core(action, close, state):
+    """
+    Pure-arithmetic core of BankNiftyEnv.step, compiled with Numba.
+
+    state = [balance, position, entry_price, total_profit], updated in-place.
+    Returns the step reward.
+    """
+    reward = 0.0
+    if action == 1 and state[1] == 0.0:  # Buy / Long
+        state[1] = 1.0
+        state[2] = close
+        # Slight penalty for trade execution
+        reward = -0.01
+    elif action == 2 and state[1] == 1.0:  # Sell / Exit
+        profit_pct = (close - state[2]) / state[2]
+        reward = profit_pct * 10.0  # Scaled reward
+        state[0] *= (1.0 + profit_pct)
+        state[3] += close - state[2]
+        state[1] = 0.0
+    return reward
+
+
 class BankNiftyEnv(gym.Env):
     """
     Custom Environment for Bank Nifty Trading that follows gymnasium interface.
@@ -17,79 +43,102 @@ class BankNiftyEnv(gym.Env):
 
     def __init__(self, df, features, initial_balance=100000):
         super(BankNiftyEnv, self).__init__()
-        
+
         self.df = df
         self.features = features
         self.initial_balance = initial_balance
-        
+
         # Action space: 0 = Hold/Neutral, 1 = Buy (Long), 2 = Sell (Exit/Short)
         self.action_space = spaces.Discrete(3)
-        
+
         # Observation space: Features + Balance + Current Position
         self.observation_space = spaces.Box(
             low=-np.inf, high=np.inf, shape=(len(features) + 2,), dtype=np.float32
         )
-        
+
         if self.df is not None:
+            # NumPy caches so the per-step path never touches pandas
+            self._feat_array = df[features].to_numpy(dtype=np.float32)
+            self._close_array = df['Close'].to_numpy(dtype=np.float64)
+            self._n = len(df)
+            # Drop the DataFrame: the env only needs the arrays, and a
+            # smaller env is cheaper to hold per parallel worker
+            self.df = None
             self.reset()
 
     def reset(self, seed=None, options=None):
         super().reset(seed=seed)
-        self.balance = self.initial_balance
         self.current_step = 0
-        self.position = 0 # 0: None, 1: Long
-        self.entry_price = 0
-        self.total_profit = 0
-        
+        # state = [balance, position, entry_price, total_profit]
+        self._state = np.array([self.initial_balance, 0.0, 0.0, 0.0], dtype=np.float64)
+        self._info = {"balance": self.initial_balance, "profit": 0.0}
+
         return self._get_observation(), {}
 
+    @property
+    def balance(self):
+        return self._state[0]
+
+    @property
+    def position(self):
+        return int(self._state[1])
+
+    @property
+    def entry_price(self):
+        return self._state[2]
+
+    @property
+    def total_profit(self):
+        return self._state[3]
+
     def _get_observation(self):
-        obs = self.df[self.features].iloc[self.current_step].values
+        obs = np.empty(len(self.features) + 2, dtype=np.float32)
+        obs[:-2] = self._feat_array[self.current_step]
         # Append balance and position normalized roughly
-        obs = np.append(obs, [self.balance / 100000, self.position])
-        return obs.astype(np.float32)
+        obs[-2] = self._state[0] / 100000
+        obs[-1] = self._state[1]
+        return obs
 
     def step(self, action):
-        current_price = self.df['Close'].iloc[self.current_step]
-        reward = 0
-        terminated = False
+        reward = _step_core(action, self._close_array[self.current_step], self._state)
         truncated = False
-        
-        # Execute Action
-        if action == 1: # Buy / Long
-            if self.position == 0:
-                self.position = 1
-                self.entry_price = current_price
-                # Slight penalty for trade execution
-                reward = -0.01
-        
-        elif action == 2: # Sell / Exit
-            if self.position == 1:
-                profit_pct = (current_price - self.entry_price) / self.entry_price
-                reward = profit_pct * 10 # Scaled reward
-                self.balance *= (1 + profit_pct)
-                self.total_profit += (current_price - self.entry_price)
-                self.position = 0
-        
+
         # Move to next step
         self.current_step += 1
-        
-        if self.current_step >= len(self.df) - 1:
-            terminated = True
-        
+
+        terminated = self.current_step >= self._n - 1
+
         obs = self._get_observation()
-        info = {"balance": self.balance, "profit": self.total_profit}
-        
-        return obs, reward, terminated, truncated, info
+        # Reuse a single info dict to avoid a per-step allocation
+        self._info["balance"] = self._state[0]
+        self._info["profit"] = self._state[3]
+
+        return obs, reward, terminated, truncated, self._info
 
     def render(self, mode='human'):
         print(f"Step: {self.current_step}, Balance: {self.balance:.2f}, Profit: {self.total_profit:.2f}")
 
 class RLTradingAgent:
-    def __init__(self, df, features):
-        self.env = BankNiftyEnv(df, features)
-        self.model = PPO("MlpPolicy", self.env, verbose=1)
+    def __init__(self, df, features, n_envs: int = 1):
         self.features = features
+        # Parallel rollouts only make sense when training on real data;
+        # inference-only construction (df=None) must never fan out worker
+        # processes just to host a loaded policy
+        if df is None:
+            n_envs = 1
+        self.n_envs = n_envs
+
+        if n_envs > 1:
+            # Parallel rollout collection: env.step is Python-bound, so
+            # filling the PPO buffer from n_envs worker processes is the
+            # main remaining throughput lever
+            self.env = SubprocVecEnv(
+                [(lambda: BankNiftyEnv(df, features)) for _ in range(n_envs)]
+            )
+        else:
+            self.env = BankNiftyEnv(df, features)
+
+        self.model = PPO("MlpPolicy", self.env, verbose=1)
         
         # Dynamic paths
         base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -122,7 +171,7 @@ if __name__ == "__main__":
     dp = DataPipeline("^NSEBANK")
     if dp.run_full_pipeline():
         me = ModelEngine()
-        agent = RLTradingAgent(dp.train_data, me.features)
+        agent = RLTradingAgent(dp.train_data, me.features, n_envs=8)
         agent.train(total_timesteps=5000)
         
         # Test on 2-year testing data
@@ -7,7 +7,10 @@ selection, entry/exit timing, and P&L for performance analysis.
 """
 
 import asyncio
-import json
+import orjson
+import os
+import random
+from time import monotonic
 from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -15,6 +18,17 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared RNG for the mock LTP/VIX helpers
+_RNG = random.Random()
+
+# Mock option premium by (signal, near_the_money); HOLD falls back to 200
+_PREMIUM_TABLE = {
+    ("BUY_CE", True): 250,
+    ("BUY_CE", False): 150,
+    ("BUY_PE", True): 250,
+    ("BUY_PE", False): 150,
+}
+
 class SimulationEngine:
     """
     Tracks live AI predictions and compares them against actual market movements.
@@ -31,21 +45,65 @@ class SimulationEngine:
         
         # Track active predictions waiting for outcomes
         self.active_predictions: List[Dict] = []
+
+        # Bound concurrent outcome resolution (broker/disk I/O)
+        self._outcome_semaphore = asyncio.Semaphore(8)
+
+        # One timer task per in-flight prediction (event-driven outcomes)
+        self._outcome_tasks = set()
+
+        # Reused market-data pipeline (lazy; keeps the HTTP session alive)
+        self._pipeline = None
+
+        # Live count of today's completions so status polls stay O(1)
+        self._completed_today = 0
+        self._completed_today_date = None
+
+        # Saves buffered between flushes (one write+fsync per tick)
+        self._pending_saves: List[Dict] = []
+
+        # Per-date timestamp -> prediction index, so repeated reads and
+        # duplicate resolution are dict lookups instead of file rescans
+        self._day_cache: Dict[str, Dict[str, Dict]] = {}
         
         # Market hours (IST)
         self.market_open = time(9, 15)
         self.market_close = time(15, 30)
-        
+
+        # (second, result) cache — the status endpoint and the loop both
+        # poll this, so repeated calls within a second are a tuple lookup
+        self._mh_cache = (-1, False)
+
     def is_market_hours(self) -> bool:
         """Check if current time is within market hours (IST)."""
+        sec = int(monotonic())
+        if sec == self._mh_cache[0]:
+            return self._mh_cache[1]
+
         now = datetime.now()
-        current_time = now.time()
-        
+
         # Check if it's a weekday (Monday=0, Sunday=6)
         if now.weekday() > 4:  # Saturday or Sunday
-            return False
-            
-        return self.market_open <= current_time <= self.market_close
+            result = False
+        else:
+            # Exact time comparison: the close is 15:30:00 sharp, not the
+            # whole 15:30 minute
+            result = self.market_open <= now.time() <= self.market_close
+
+        self._mh_cache = (sec, result)
+        return result
+
+    def seconds_to_next_open(self) -> float:
+        """Seconds until the next market open (9:15 on the next weekday)."""
+        now = datetime.now()
+        target = datetime.combine(now.date(), self.market_open)
+
+        if now.time() >= self.market_open:
+            target += timedelta(days=1)
+        while target.weekday() > 4:  # Skip Saturday/Sunday
+            target += timedelta(days=1)
+
+        return max(1.0, (target - now).total_seconds())
     
     async def capture_prediction(self, intelligence_layer, symbol: str = "BANKNIFTY") -> Optional[Dict]:
         """
@@ -59,23 +117,22 @@ class SimulationEngine:
             Prediction data dict or None if prediction fails
         """
         try:
-            # Get hybrid prediction from intelligence layer
-            result = intelligence_layer.predict_hybrid(symbol)
-            
+            # Get hybrid prediction from intelligence layer — blocking
+            # CPU/IO work, so run it in a worker thread instead of
+            # stalling the event loop
+            result = await asyncio.to_thread(intelligence_layer.predict_hybrid, symbol)
+
             if not result:
                 logger.warning("No prediction result from intelligence layer")
                 return None
-            
-            # Get current market data
-            from data_pipeline import DataPipeline
-            pipeline = DataPipeline(symbol=f"^NSEBANK", interval="1m")
-            pipeline.fetch_data()
-            
-            if pipeline.raw_data is None or len(pipeline.raw_data) == 0:
+
+            # Get current market data (blocking network fetch, same treatment)
+            latest = await asyncio.to_thread(self._fetch_latest_sync)
+
+            if latest is None:
                 logger.warning("No market data available")
                 return None
-            
-            latest = pipeline.raw_data.iloc[-1]
+
             spot_price = float(latest['Close'])
             
             # Calculate strike price based on signal
@@ -85,8 +142,12 @@ class SimulationEngine:
             # Get entry price (mock LTP for now - in production, fetch from broker)
             entry_price = self._get_option_ltp(symbol, strike_price, signal, spot_price)
             
+            now_dt = datetime.now()
             prediction = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_dt.isoformat(),
+                # Numeric twin of timestamp; the outcome timer anchors
+                # its exit horizon to this capture instant
+                "_entry_epoch": now_dt.timestamp(),
                 "prediction": {
                     "signal": signal,
                     "strike": strike_price,
@@ -111,6 +172,22 @@ class SimulationEngine:
             logger.error(f"Failed to capture prediction: {e}")
             return None
     
+    def _fetch_latest_sync(self):
+        """
+        Blocking market-data fetch; runs in a worker thread via
+        asyncio.to_thread. Returns the latest bar or None.
+        """
+        if self._pipeline is None:
+            from data_pipeline import DataPipeline
+            self._pipeline = DataPipeline(symbol="^NSEBANK", interval="1m")
+
+        self._pipeline.fetch_data()
+
+        if self._pipeline.raw_data is None or len(self._pipeline.raw_data) == 0:
+            return None
+
+        return self._pipeline.raw_data.iloc[-1]
+
     def _calculate_strike_price(self, spot_price: float, signal: str) -> int:
         """Calculate appropriate strike price based on signal and spot price."""
         # Round to nearest 100 (BANKNIFTY strikes are in 100s)
@@ -131,56 +208,51 @@ class SimulationEngine:
         Get option LTP (Last Traded Price).
         Mock implementation - in production, fetch from broker API.
         """
-        # Simple mock based on moneyness
-        distance = abs(strike - spot_price)
-        
-        if signal == "BUY_CE":
-            # Call premium decreases as strike moves OTM
-            base_premium = 250 if distance < 200 else 150
-        elif signal == "BUY_PE":
-            # Put premium decreases as strike moves OTM
-            base_premium = 250 if distance < 200 else 150
-        else:
-            base_premium = 200
-        
+        # Simple mock based on moneyness: premium decreases as the strike
+        # moves OTM, looked up from the precomputed table
+        base_premium = _PREMIUM_TABLE.get((signal, abs(strike - spot_price) < 200), 200)
+
         # Add some randomness
-        import random
-        return base_premium + random.uniform(-20, 20)
-    
+        return base_premium + _RNG.uniform(-20, 20)
+
     def _get_vix(self) -> float:
         """Get India VIX value. Mock implementation."""
-        import random
-        return 12.0 + random.uniform(-2, 2)
+        return 12.0 + _RNG.uniform(-2, 2)
     
-    async def check_outcomes(self, intelligence_layer) -> int:
+    def _schedule_outcome(self, prediction: Dict, intelligence_layer):
         """
-        Check outcomes for pending predictions that have crossed their exit duration.
-        
-        Returns:
-            Number of outcomes processed
+        Arm a timer task that resolves the prediction at its exit horizon.
+
+        Event-driven replacement for the old per-tick scan over
+        active_predictions: the loop's timer heap wakes each prediction
+        exactly once instead of polling the whole list.
         """
-        if not self.active_predictions:
-            return 0
-        
-        now = datetime.now()
-        outcomes_processed = 0
-        
-        for pred in self.active_predictions[:]:  # Create a copy to iterate
-            if pred['status'] != 'PENDING':
-                continue
-            
-            entry_time = datetime.fromisoformat(pred['timestamp'])
-            elapsed = (now - entry_time).total_seconds()
-            
-            if elapsed >= self.exit_duration:
-                # Time to calculate outcome
-                await self._calculate_outcome(pred, intelligence_layer)
-                outcomes_processed += 1
-                
-        return outcomes_processed
-    
+        task = asyncio.create_task(self._await_outcome(prediction, intelligence_layer))
+        self._outcome_tasks.add(task)
+        task.add_done_callback(self._outcome_tasks.discard)
+
+    async def _await_outcome(self, prediction: Dict, intelligence_layer):
+        # Anchor the horizon to capture time rather than scheduling time,
+        # so a delayed schedule still resolves exit_duration after entry
+        entry_epoch = prediction.get("_entry_epoch")
+        delay = self.exit_duration
+        if entry_epoch is not None:
+            delay = max(0.0, entry_epoch + self.exit_duration - datetime.now().timestamp())
+        await asyncio.sleep(delay)
+        await self._calculate_outcome(prediction, intelligence_layer)
+        self._flush_saves()
+
+        # Drop resolved predictions so the pending list stays bounded
+        self.active_predictions = [
+            p for p in self.active_predictions if p['status'] == 'PENDING'
+        ]
+
     async def _calculate_outcome(self, prediction: Dict, intelligence_layer):
         """Calculate actual outcome for a prediction."""
+        async with self._outcome_semaphore:
+            await self._calculate_outcome_inner(prediction, intelligence_layer)
+
+    async def _calculate_outcome_inner(self, prediction: Dict, intelligence_layer):
         try:
             signal = prediction['prediction']['signal']
             entry_price = prediction['prediction']['entry_price']
@@ -206,9 +278,8 @@ class SimulationEngine:
                 pnl_pct = ((exit_price - entry_price) / entry_price) * 100
             
             # Simulate max favorable and adverse moves
-            import random
-            max_favorable = exit_price + random.uniform(10, 30)
-            max_adverse = exit_price - random.uniform(10, 30)
+            max_favorable = exit_price + _RNG.uniform(10, 30)
+            max_adverse = exit_price - _RNG.uniform(10, 30)
             
             prediction['actual_outcome'] = {
                 "exit_timestamp": datetime.now().isoformat(),
@@ -221,7 +292,8 @@ class SimulationEngine:
             }
             
             prediction['status'] = 'COMPLETED'
-            
+            self._note_completion()
+
             # Save to disk
             self._save_prediction(prediction)
             
@@ -231,33 +303,70 @@ class SimulationEngine:
             logger.error(f"Failed to calculate outcome: {e}")
             prediction['status'] = 'ERROR'
     
+    def _jsonl_path(self, date_str: str) -> Path:
+        return self.data_dir / f"simulation_{date_str}.jsonl"
+
+    def _legacy_path(self, date_str: str) -> Path:
+        return self.data_dir / f"simulation_{date_str}.json"
+
     def _save_prediction(self, prediction: Dict):
-        """Save prediction to daily JSON file."""
+        """
+        Queue prediction for append to the daily JSON-Lines file.
+
+        Updates (e.g. the COMPLETED rewrite of a PENDING entry) append a
+        new line with the same timestamp; readers dedupe last-wins. Saves
+        are buffered and written in one flush per outcome tick.
+        """
+        self._pending_saves.append(prediction)
+
+    def _flush_saves(self):
+        """Write all buffered predictions in a single append + fsync."""
+        if not self._pending_saves:
+            return
+
         today = datetime.now().strftime("%Y-%m-%d")
-        file_path = self.data_dir / f"simulation_{today}.json"
-        
-        # Load existing data
+        with open(self._jsonl_path(today), 'ab') as f:
+            f.write(b'\n'.join(orjson.dumps(p) for p in self._pending_saves) + b'\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Keep the loaded day index in sync (if the day was never loaded,
+        # the next _load_day reads the full file and rebuilds it)
+        if today in self._day_cache:
+            index = self._day_cache[today]
+            for p in self._pending_saves:
+                index[p['timestamp']] = p
+
+        self._pending_saves.clear()
+
+    def _load_day(self, date_str: str) -> Dict:
+        """
+        Load a day's predictions, deduplicating rewritten entries by
+        timestamp (last write wins). Falls back to the old whole-file JSON
+        format for dates recorded before the JSONL switch.
+        """
+        cached = self._day_cache.get(date_str)
+        if cached is not None:
+            return {"date": date_str, "predictions": list(cached.values())}
+
+        by_timestamp = {}
+
+        file_path = self._jsonl_path(date_str)
         if file_path.exists():
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        p = orjson.loads(line)
+                        by_timestamp[p['timestamp']] = p
         else:
-            data = {"date": today, "predictions": []}
-        
-        # Append or update prediction
-        existing_idx = None
-        for idx, p in enumerate(data['predictions']):
-            if p['timestamp'] == prediction['timestamp']:
-                existing_idx = idx
-                break
-        
-        if existing_idx is not None:
-            data['predictions'][existing_idx] = prediction
-        else:
-            data['predictions'].append(prediction)
-        
-        # Save
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+            legacy = self._legacy_path(date_str)
+            if legacy.exists():
+                data = orjson.loads(legacy.read_bytes())
+                by_timestamp = {p['timestamp']: p for p in data.get('predictions', [])}
+
+        self._day_cache[date_str] = by_timestamp
+        return {"date": date_str, "predictions": list(by_timestamp.values())}
     
     async def run_simulation_loop(self, intelligence_layer):
         """
@@ -266,36 +375,50 @@ class SimulationEngine:
         """
         logger.info("🔭 Observatory Simulation Engine started")
         self.is_running = True
-        
+
+        # Monotonic tick schedule so capture work time doesn't drift the
+        # 5-minute cadence away from candle boundaries
+        next_tick = monotonic()
+
         try:
             while self.is_running:
                 if not self.is_market_hours():
-                    logger.info("⏸️  Outside market hours, pausing simulation...")
-                    await asyncio.sleep(60)  # Check every minute
+                    # Sleep the whole gap when open is far off (overnight,
+                    # weekends); otherwise keep the 60s heartbeat
+                    gap = self.seconds_to_next_open()
+                    sleep_for = gap if gap > 3600 else min(60.0, gap)
+                    logger.info(f"⏸️  Outside market hours, pausing simulation for {sleep_for:.0f}s...")
+                    await asyncio.sleep(sleep_for)
+                    next_tick = monotonic()
                     continue
-                
-                # Check outcomes for pending predictions
-                outcomes = await self.check_outcomes(intelligence_layer)
-                if outcomes > 0:
-                    logger.info(f"Processed {outcomes} outcomes")
-                
-                # Capture new prediction
+
+                # Capture new prediction; its outcome resolves itself via
+                # a timer task at the exit horizon
                 prediction = await self.capture_prediction(intelligence_layer)
                 if prediction:
                     self.active_predictions.append(prediction)
-                
-                # Wait for next prediction interval
-                await asyncio.sleep(self.prediction_interval)
+                    self._schedule_outcome(prediction, intelligence_layer)
+
+                # Wait for the next scheduled tick (skip missed ticks)
+                next_tick += self.prediction_interval
+                sleep_for = next_tick - monotonic()
+                if sleep_for > 0:
+                    await asyncio.sleep(sleep_for)
+                else:
+                    next_tick = monotonic()
                 
         except Exception as e:
             logger.error(f"Simulation loop error: {e}")
         finally:
             self.is_running = False
+            self._flush_saves()
             logger.info("🛑 Observatory Simulation Engine stopped")
     
     def stop(self):
-        """Stop the simulation loop."""
+        """Stop the simulation loop and cancel in-flight outcome timers."""
         self.is_running = False
+        for task in list(self._outcome_tasks):
+            task.cancel()
     
     def get_status(self) -> Dict:
         """Get current simulation status."""
@@ -306,18 +429,25 @@ class SimulationEngine:
             "completed_today": self._count_todays_completions()
         }
     
+    def _note_completion(self):
+        """Bump the live completion counter, resetting it at the day rollover."""
+        today = datetime.now().date()
+        if self._completed_today_date != today:
+            self._completed_today = 0
+            self._completed_today_date = today
+        self._completed_today += 1
+
     def _count_todays_completions(self) -> int:
-        """Count completed predictions today."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        file_path = self.data_dir / f"simulation_{today}.json"
-        
-        if not file_path.exists():
-            return 0
-        
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        return len([p for p in data.get('predictions', []) if p['status'] == 'COMPLETED'])
+        """Count completed predictions today (live counter, seeded from disk)."""
+        today = datetime.now().date()
+        if self._completed_today_date != today:
+            # First call of the day (or after a restart): scan disk once
+            data = self._load_day(today.strftime("%Y-%m-%d"))
+            self._completed_today = len(
+                [p for p in data.get('predictions', []) if p['status'] == 'COMPLETED']
+            )
+            self._completed_today_date = today
+        return self._completed_today
     
     def get_results(self, date: Optional[str] = None) -> Dict:
         """
@@ -331,14 +461,8 @@ class SimulationEngine:
         """
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
-        
-        file_path = self.data_dir / f"simulation_{date}.json"
-        
-        if not file_path.exists():
-            return {"date": date, "predictions": []}
-        
-        with open(file_path, 'r') as f:
-            return json.load(f)
+
+        return self._load_day(date)
     
     def get_performance_summary(self, date: Optional[str] = None) -> Dict:
         """Get performance summary for a given date."""
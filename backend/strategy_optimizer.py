@@ -3,6 +3,24 @@ import logging
 
 logger = logging.getLogger("StrategyOptimizer")
 
+# Convergence factor order and weights (technical, tft, rl, sentiment, options)
+_CONVERGENCE_KEYS = ("technical", "tft", "rl", "sentiment", "options")
+_CONVERGENCE_WEIGHTS = np.array([0.40, 0.20, 0.15, 0.15, 0.10])
+_TECH_MAP = {"UP": 1.0, "DOWN": -1.0}
+_RL_MAP = {1: 1.0, 2: -1.0}
+
+
+def _convergence_row(signals):
+    """Map one signals dict to its 5-element contribution vector."""
+    pcr = signals.get('pcr', 1.0)
+    return (
+        _TECH_MAP.get(signals.get('tech_pred'), 0.0),
+        _TECH_MAP.get(signals.get('tft_pred'), 0.0),
+        _RL_MAP.get(signals.get('rl_action'), 0.0),
+        signals.get('sentiment_score', 0.0),
+        1.0 if pcr < 0.85 else -1.0 if pcr > 1.15 else 0.0,
+    )
+
 class StrategyOptimizer:
     """
     Calculates dynamic entry/exit parameters for Tradeverse.
@@ -63,55 +81,79 @@ class StrategyOptimizer:
         
         return sorted(list(set(targets)), reverse=(side == "SELL"))
 
+    @staticmethod
+    def calculate_targets_batch(prices, sides, atrs, regimes="NOMINAL",
+                                pivot_levels=None, gex_data=None):
+        """
+        Vectorized calculate_targets for backtest sweeps.
+
+        Args:
+            prices, atrs: (K,) float arrays
+            sides: (K,) array of "BUY"/"SELL"
+            regimes: (K,) array of regime names, or one name for all rows
+            pivot_levels: optional dict of (K,) arrays with R1/R2/S1/S2
+            gex_data: optional dict of (K,) arrays with call_wall/put_wall
+
+        Returns:
+            (K, 5) float array of targets, NaN-padded, sorted nearest-first
+            per row (ascending for BUY, descending for SELL)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        atrs = np.asarray(atrs, dtype=np.float64)
+        K = len(prices)
+
+        buy = np.asarray(sides) == "BUY"
+        sign = np.where(buy, 1.0, -1.0)
+        trending = np.broadcast_to(np.asarray(regimes) == "TRENDING_INTRADAY", (K,))
+
+        def _col(d, key):
+            v = d.get(key)
+            return np.asarray(v, dtype=np.float64) if v is not None else np.full(K, np.nan)
+
+        targets = np.full((K, 5), np.nan)
+
+        # Base ATR multiples adjusted by regime
+        targets[:, 0] = prices + sign * np.where(trending, 3.0, 1.5) * atrs
+        targets[:, 1] = prices + sign * np.where(trending, 5.0, 2.5) * atrs
+
+        # Pivot levels with regime filtering (second level only when trending)
+        if pivot_levels:
+            targets[:, 2] = np.where(buy, _col(pivot_levels, 'R1'), _col(pivot_levels, 'S1'))
+            level2 = np.where(buy, _col(pivot_levels, 'R2'), _col(pivot_levels, 'S2'))
+            targets[:, 3] = np.where(trending, level2, np.nan)
+
+        # GEX walls: exit slightly before the wall when it sits beyond price
+        if gex_data:
+            call_wall = _col(gex_data, 'call_wall')
+            put_wall = _col(gex_data, 'put_wall')
+            buy_exit = np.where(call_wall > prices, call_wall - 10, np.nan)
+            sell_exit = np.where((put_wall > 0) & (put_wall < prices), put_wall + 10, np.nan)
+            targets[:, 4] = np.where(buy, buy_exit, sell_exit)
+
+        # Sort nearest-first per row; the sign flip makes SELL rows
+        # descending, and NaN padding stays at the end either way
+        ordered = np.sort(np.where(buy[:, None], targets, -targets), axis=1)
+        return np.where(buy[:, None], ordered, -ordered)
+
     @staticmethod
     def calculate_convergence_score(signals):
         """
         signals: Dict of factor -> score/label
         Returns a tuple of (aggregate_score, component_scores)
         """
-        weights = {
-            "technical": 0.40,  # AI Model Prediction
-            "tft": 0.20,       # Temporal Context
-            "rl": 0.15,        # Sniper Timing
-            "sentiment": 0.15, # News/Social
-            "options": 0.10    # PCR/OI
-        }
-        
-        score = 0.0
-        details = {k: 0.0 for k in weights.keys()}
-        
-        # Mapping logic
-        if signals.get('tech_pred') == "UP": 
-            score += weights['technical']
-            details['technical'] = 1.0
-        elif signals.get('tech_pred') == "DOWN": 
-            score -= weights['technical']
-            details['technical'] = -1.0
-        
-        if signals.get('tft_pred') == "UP": 
-            score += weights['tft']
-            details['tft'] = 1.0
-        elif signals.get('tft_pred') == "DOWN": 
-            score -= weights['tft']
-            details['tft'] = -1.0
-        
-        if signals.get('rl_action') == 1: 
-            score += weights['rl']
-            details['rl'] = 1.0
-        elif signals.get('rl_action') == 2: 
-            score -= weights['rl']
-            details['rl'] = -1.0
-        
-        sent_val = signals.get('sentiment_score', 0)
-        score += (sent_val * weights['sentiment'])
-        details['sentiment'] = sent_val
-        
-        pcr = signals.get('pcr', 1.0)
-        if pcr < 0.85: 
-            score += weights['options']
-            details['options'] = 1.0
-        elif pcr > 1.15: 
-            score -= weights['options']
-            details['options'] = -1.0
-        
+        contrib = _convergence_row(signals)
+        score = float(np.dot(contrib, _CONVERGENCE_WEIGHTS))
+        details = dict(zip(_CONVERGENCE_KEYS, contrib))
         return score, details
+
+    @staticmethod
+    def calculate_convergence_batch(signals_list):
+        """
+        Score many signal dicts in one matmul.
+
+        Returns an (N,) array of aggregate scores, ordered like the input.
+        """
+        if not signals_list:
+            return np.empty(0)
+        contrib = np.array([_convergence_row(s) for s in signals_list])
+        return contrib @ _CONVERGENCE_WEIGHTS
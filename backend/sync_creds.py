@@ -1,5 +1,6 @@
 import json
-import os
+import hashlib
+from pathlib import Path
 
 with open('settings_source.json', 'r') as f:
     creds = json.load(f)
@@ -13,7 +14,13 @@ settings = {
     "ACTIVE_BROKER": "ANGEL"
 }
 
-with open('settings.json', 'w') as f:
-    json.dump(settings, f, indent=4)
+new_blob = json.dumps(settings, indent=4).encode()
 
-print("Mapped credentials to tradeverse settings.json")
+# Skip the rewrite when nothing changed — orchestrators re-run this script
+target = Path('settings.json')
+if target.exists() and hashlib.blake2b(target.read_bytes(), digest_size=16).digest() == \
+        hashlib.blake2b(new_blob, digest_size=16).digest():
+    print("settings.json already up to date, skipping write")
+else:
+    target.write_bytes(new_blob)
+    print("Mapped credentials to tradeverse settings.json")
@@ -1,11 +1,14 @@
 import redis
 import json
+import hashlib
 import os
+from pathlib import Path
 
 # Connect to Redis
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 try:
-    r = redis.from_url(REDIS_URL, decode_responses=True)
+    # One-shot script: a single connection avoids pool setup overhead
+    r = redis.from_url(REDIS_URL, decode_responses=True, single_connection_client=True)
     r.ping()
     print(f"Connected to Redis at {REDIS_URL}")
 except Exception as e:
@@ -30,11 +33,20 @@ settings = {
     "ACTIVE_BROKER": "ANGEL"
 }
 
-# Save to Redis
-r.set(SETTINGS_KEY, json.dumps(settings))
-print(f"✅ Successfully injected LIVE credentials for {USER_ID} into {SETTINGS_KEY}")
+# Save to Redis only when the payload actually changed
+settings_blob = json.dumps(settings, separators=(',', ':'))
+if r.get(SETTINGS_KEY) == settings_blob:
+    print(f"Redis key {SETTINGS_KEY} already up to date, skipping write")
+else:
+    r.set(SETTINGS_KEY, settings_blob)
+    print(f"✅ Successfully injected LIVE credentials for {USER_ID} into {SETTINGS_KEY}")
 
-# Also update global settings.json for safety
-with open('settings.json', 'w') as f:
-    json.dump(settings, f, indent=4)
-print("✅ Updated local settings.json")
+# Also update global settings.json for safety (skipped when identical)
+new_blob = json.dumps(settings, indent=4).encode()
+target = Path('settings.json')
+if target.exists() and hashlib.blake2b(target.read_bytes(), digest_size=16).digest() == \
+        hashlib.blake2b(new_blob, digest_size=16).digest():
+    print("settings.json already up to date, skipping write")
+else:
+    target.write_bytes(new_blob)
+    print("✅ Updated local settings.json")
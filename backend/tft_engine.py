@@ -1,6 +1,7 @@
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
+from torch.utils.data import DataLoader, TensorDataset
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import StandardScaler
@@ -10,6 +11,13 @@ import os
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("TFTEngine")
 
+# Static shapes per seq_len, so let cuDNN autotune, and allow TF32 for
+# the fp32 GEMMs that stay outside autocast — free throughput on Ampere+
+torch.backends.cudnn.benchmark = True
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.allow_tf32 = True
+torch.set_float32_matmul_precision("high")
+
 class GatedResidualNetwork(nn.Module):
     def __init__(self, input_size, hidden_size, output_size, dropout=0.1):
         super(GatedResidualNetwork, self).__init__()
@@ -30,42 +38,77 @@ class GatedResidualNetwork(nn.Module):
 class VariableSelectionNetwork(nn.Module):
     def __init__(self, input_size, num_vars, hidden_size, dropout=0.1):
         super(VariableSelectionNetwork, self).__init__()
-        self.grns = nn.ModuleList([GatedResidualNetwork(input_size, hidden_size, hidden_size, dropout) for _ in range(num_vars)])
+        # Per-variable GRNs fused into grouped weight tensors: each layer
+        # becomes one batched matmul over all variables instead of
+        # num_vars sequential small GEMMs
+        self.var_lin1_w = nn.Parameter(torch.empty(num_vars, input_size, hidden_size))
+        self.var_lin1_b = nn.Parameter(torch.zeros(num_vars, hidden_size))
+        self.var_lin2_w = nn.Parameter(torch.empty(num_vars, hidden_size, hidden_size))
+        self.var_lin2_b = nn.Parameter(torch.zeros(num_vars, hidden_size))
+        self.var_gate_w = nn.Parameter(torch.empty(num_vars, hidden_size, hidden_size))
+        self.var_gate_b = nn.Parameter(torch.zeros(num_vars, hidden_size))
+        if input_size != hidden_size:
+            self.var_res_w = nn.Parameter(torch.empty(num_vars, input_size, hidden_size))
+            nn.init.xavier_uniform_(self.var_res_w)
+        else:
+            self.var_res_w = None
+        for w in (self.var_lin1_w, self.var_lin2_w, self.var_gate_w):
+            nn.init.xavier_uniform_(w)
+        self.dropout = nn.Dropout(dropout)
         self.selector_grn = GatedResidualNetwork(num_vars * input_size, hidden_size, num_vars, dropout)
         self.softmax = nn.Softmax(dim=-1)
 
     def forward(self, x):
         # x shape: (batch, num_vars, input_size)
-        var_outputs = []
-        for i, grn in enumerate(self.grns):
-            var_outputs.append(grn(x[:, i, :]))
-        
+        h1 = F.elu(torch.einsum('bvi,vih->bvh', x, self.var_lin1_w) + self.var_lin1_b)
+        h2 = self.dropout(torch.einsum('bvh,vho->bvo', h1, self.var_lin2_w) + self.var_lin2_b)
+        g = torch.sigmoid(torch.einsum('bvh,vho->bvo', h1, self.var_gate_w) + self.var_gate_b)
+        if self.var_res_w is not None:
+            res = torch.einsum('bvi,vih->bvh', x, self.var_res_w)
+        else:
+            res = x
+
         # Shape: (batch, num_vars, hidden_size)
-        stacked_vars = torch.stack(var_outputs, dim=1)
-        
-        flattened_x = x.view(x.size(0), -1)
-        weights = self.softmax(self.selector_grn(flattened_x)).unsqueeze(-1)
-        
-        selected_output = torch.sum(weights * stacked_vars, dim=1)
-        return selected_output, weights
+        stacked_vars = res + (g * h2)
+
+        flattened_x = x.reshape(x.size(0), -1)
+        weights = self.softmax(self.selector_grn(flattened_x))
+
+        # einsum reduces over num_vars without materializing the
+        # broadcast (B, num_vars, hidden) product
+        selected_output = torch.einsum('bv,bvh->bh', weights, stacked_vars)
+        return selected_output, weights.unsqueeze(-1)
 
 class SimplifiedTFT(nn.Module):
-    def __init__(self, num_features, hidden_size, output_size=1, num_heads=4, dropout=0.1):
+    def __init__(self, num_features, hidden_size, output_size=1, num_heads=4, dropout=0.1, seq_len=30):
         super(SimplifiedTFT, self).__init__()
         self.hidden_size = hidden_size
         
-        # Feature embeddings
-        self.input_projections = nn.ModuleList([nn.Linear(1, hidden_size) for _ in range(num_features)])
-        
+        # Feature embeddings: one (num_features, hidden) weight tensor so
+        # all per-feature projections run as a single einsum instead of
+        # num_features tiny GEMMs
+        self.proj_weight = nn.Parameter(torch.empty(num_features, hidden_size))
+        self.proj_bias = nn.Parameter(torch.zeros(num_features, hidden_size))
+        nn.init.xavier_uniform_(self.proj_weight)
+
         # Variable Selection
         self.vsn = VariableSelectionNetwork(hidden_size, num_features, hidden_size, dropout)
         
-        # Temporal Processing (LSTM)
-        self.lstm = nn.LSTM(hidden_size, hidden_size, batch_first=True)
-        
-        # Multi-Head Attention
-        self.attention = nn.MultiheadAttention(hidden_size, num_heads, dropout=dropout, batch_first=True)
-        
+        # Temporal Processing: causal self-attention fills the LSTM's
+        # role but runs parallel across time instead of stepping through
+        # seq_len recurrent cells
+        self.pos_emb = nn.Parameter(torch.zeros(1, seq_len, hidden_size))
+        self.qkv_temporal = nn.Linear(hidden_size, 3 * hidden_size)
+        self.temporal_out = nn.Linear(hidden_size, hidden_size)
+
+        # Multi-Head Attention via scaled_dot_product_attention: avoids
+        # materializing the (B, H, T, T) logits and dispatches to flash
+        # kernels on CUDA
+        self.num_heads = num_heads
+        self.attn_dropout = dropout
+        self.qkv = nn.Linear(hidden_size, 3 * hidden_size)
+        self.out_proj = nn.Linear(hidden_size, hidden_size)
+
         # Final Output
         self.post_attention_grn = GatedResidualNetwork(hidden_size, hidden_size, hidden_size, dropout)
         self.output_layer = nn.Linear(hidden_size, output_size)
@@ -74,23 +117,40 @@ class SimplifiedTFT(nn.Module):
         # x shape: (batch, seq_len, num_features)
         batch_size, seq_len, num_features = x.shape
         
-        # Project each feature independently
-        projected_features = []
-        for i in range(num_features):
-            projected_features.append(self.input_projections[i](x[:, :, i].unsqueeze(-1)))
-        
-        # Shape: (batch * seq_len, num_features, hidden_size)
-        combined_features = torch.stack(projected_features, dim=2).view(-1, num_features, self.hidden_size)
+        # Project each feature independently — one kernel launch, and the
+        # result is contiguous unlike the old stack of per-feature outputs
+        projected = torch.einsum('bsf,fh->bsfh', x, self.proj_weight) + self.proj_bias
+
+        # Shape: (batch * seq_len, num_features, hidden_size); keep it
+        # contiguous so the VSN linears stay on the addmm fast path
+        combined_features = projected.reshape(-1, num_features, self.hidden_size).contiguous()
         
         # Variable Selection locally for each time step
         vsn_out, vsn_weights = self.vsn(combined_features)
         vsn_out = vsn_out.view(batch_size, seq_len, self.hidden_size)
         
-        # LSTM for temporal context
-        lstm_out, _ = self.lstm(vsn_out)
-        
+        # Causal attention for temporal context
+        head_dim = self.hidden_size // self.num_heads
+        h = vsn_out + self.pos_emb[:, :seq_len, :]
+        qkv_t = self.qkv_temporal(h).view(batch_size, seq_len, 3, self.num_heads, head_dim)
+        qt, kt, vt = qkv_t.permute(2, 0, 3, 1, 4).unbind(0)
+        temporal = F.scaled_dot_product_attention(
+            qt, kt, vt, is_causal=True,
+            dropout_p=self.attn_dropout if self.training else 0.0
+        )
+        temporal_ctx = self.temporal_out(
+            temporal.transpose(1, 2).reshape(batch_size, seq_len, self.hidden_size)
+        )
+
         # Attention
-        attn_out, _ = self.attention(lstm_out, lstm_out, lstm_out)
+        qkv = self.qkv(temporal_ctx).view(batch_size, seq_len, 3, self.num_heads, head_dim)
+        q, k, v = qkv.permute(2, 0, 3, 1, 4).unbind(0)  # (B, H, T, head_dim)
+        attn = F.scaled_dot_product_attention(
+            q, k, v, dropout_p=self.attn_dropout if self.training else 0.0
+        )
+        attn_out = self.out_proj(
+            attn.transpose(1, 2).reshape(batch_size, seq_len, self.hidden_size)
+        )
         
         # Gate and Residual
         final_h = self.post_attention_grn(attn_out[:, -1, :]) # Take last time step
@@ -101,65 +161,139 @@ class TFTEngine:
     def __init__(self, features, seq_len=30, hidden_size=64):
         self.features = features
         self.seq_len = seq_len
-        self.model = SimplifiedTFT(len(features), hidden_size)
+        self.model = SimplifiedTFT(len(features), hidden_size, seq_len=seq_len)
         self.scaler = StandardScaler()
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        # bf16 autocast on CUDA: half the bandwidth for the attention
+        # GEMMs, no grad scaler needed
+        self.use_amp = self.device.type == "cuda"
         self.model.to(self.device)
-        
+
+        # Fuse the many small linear/gate/residual ops; reduce-overhead
+        # suits the small-batch inference path
+        try:
+            self.model = torch.compile(self.model, mode="reduce-overhead", fullgraph=False)
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, running eager: {e}")
+
+        # Frozen normalization stats (filled after fit/load): lets the
+        # hot predict path do plain array math instead of sklearn's
+        # checked transform
+        self._mean = None
+        self._std = None
+
+        # Reusable pinned staging buffer for single-window predictions —
+        # batch-1 inference is dominated by CPU-side allocation otherwise
+        self._pred_buf = torch.empty(
+            1, seq_len, len(features), dtype=torch.float32,
+            pin_memory=self.use_amp,
+        )
+
         # Dynamic paths
         base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.model_path = os.path.join(base_dir, f"tft_model_brain.pth")
+        # v2: checkpoint format changed with the attention-based temporal
+        # block — stale v1 files must not be picked up
+        self.model_path = os.path.join(base_dir, f"tft_model_brain_v2.pth")
         self.scaler_path = os.path.join(base_dir, f"tft_scaler.joblib")
 
+    def _freeze_scaler_stats(self):
+        """Caches the fitted scaler's mean/scale as float32 arrays."""
+        self._mean = self.scaler.mean_.astype(np.float32)
+        self._std = self.scaler.scale_.astype(np.float32)
+
     def prepare_sequences(self, df):
+        # Kept on CPU: the DataLoader moves mini-batches to the device
         data = self.scaler.fit_transform(df[self.features])
+        self._freeze_scaler_stats()
         targets = df['Target_Next_Day'].values
-        
-        X, y = [], []
-        for i in range(len(data) - self.seq_len):
-            X.append(data[i:i+self.seq_len])
-            y.append(targets[i+self.seq_len])
-            
-        return torch.FloatTensor(np.array(X)).to(self.device), torch.FloatTensor(np.array(y)).unsqueeze(-1).to(self.device)
-
-    def train(self, df, epochs=10, lr=0.001):
+
+        # Zero-copy strided windows, then one contiguous copy — the old
+        # append loop duplicated every row seq_len times
+        windows = np.lib.stride_tricks.sliding_window_view(
+            data, self.seq_len, axis=0
+        )[:-1].transpose(0, 2, 1)
+        X = torch.from_numpy(np.ascontiguousarray(windows, dtype=np.float32))
+        y = torch.from_numpy(
+            np.ascontiguousarray(targets[self.seq_len:], dtype=np.float32)
+        ).unsqueeze(-1)
+        return X, y
+
+    def train(self, df, epochs=10, lr=0.001, batch_size=256):
         X, y = self.prepare_sequences(df)
+        pin = self.device.type == "cuda"
+        # drop_last keeps batch shapes static so the reduce-overhead
+        # compile path can capture and replay its CUDA graphs instead of
+        # re-recording for the ragged final batch
+        loader = DataLoader(
+            TensorDataset(X, y), batch_size=batch_size, shuffle=True,
+            pin_memory=pin, num_workers=2, drop_last=len(X) > batch_size,
+        )
         optimizer = torch.optim.Adam(self.model.parameters(), lr=lr)
         criterion = nn.BCEWithLogitsLoss()
-        
+
         self.model.train()
         for epoch in range(epochs):
-            optimizer.zero_grad()
-            output = self.model(X)
-            loss = criterion(output, y)
-            loss.backward()
-            optimizer.step()
+            for xb, yb in loader:
+                xb = xb.to(self.device, non_blocking=True)
+                yb = yb.to(self.device, non_blocking=True)
+                optimizer.zero_grad()
+                with torch.autocast(device_type=self.device.type,
+                                    dtype=torch.bfloat16, enabled=self.use_amp):
+                    output = self.model(xb)
+                    loss = criterion(output, yb)
+                loss.backward()
+                optimizer.step()
             if (epoch+1) % 2 == 0:
                 logger.info(f"Epoch {epoch+1}/{epochs}, Loss: {loss.item():.4f}")
-        
+
         return loss.item()
 
     def predict(self, recent_df):
         self.model.eval()
         # Ensure we only use the features the model was trained on
-        X_data = recent_df[self.features]
-        data = self.scaler.transform(X_data)
-        X = torch.FloatTensor(data).unsqueeze(0).to(self.device)
-        with torch.no_grad():
-            output = torch.sigmoid(self.model(X))
+        X_data = recent_df.loc[:, self.features].to_numpy(dtype=np.float32)
+        if self._mean is not None:
+            data = (X_data - self._mean) / self._std
+        else:
+            data = self.scaler.transform(X_data)
+        # Stage through the pinned buffer instead of allocating per call
+        self._pred_buf.copy_(torch.from_numpy(np.asarray(data, dtype=np.float32)).unsqueeze(0))
+        X = self._pred_buf.to(self.device, non_blocking=True)
+        with torch.inference_mode():
+            with torch.autocast(device_type=self.device.type,
+                                dtype=torch.bfloat16, enabled=self.use_amp):
+                logits = self.model(X)
+            # Final sigmoid in fp32 for a stable probability
+            output = torch.sigmoid(logits.float())
         return output.item()
 
     def save_model(self):
-        torch.save(self.model.state_dict(), self.model_path)
+        # Save the underlying module's weights: torch.compile wraps them
+        # under an _orig_mod. prefix that would poison the checkpoint
+        target = getattr(self.model, "_orig_mod", self.model)
+        torch.save(target.state_dict(), self.model_path)
         import joblib
         joblib.dump(self.scaler, self.scaler_path)
         logger.info(f"TFT Model and Scaler saved to {self.model_path}")
 
     def load_model(self):
         if os.path.exists(self.model_path):
-            self.model.load_state_dict(torch.load(self.model_path, map_location=self.device))
+            try:
+                state = torch.load(self.model_path, map_location=self.device)
+                # Normalize compile-era key prefixes so checkpoints load
+                # whether or not torch.compile was active when saving
+                state = {k.removeprefix("_orig_mod."): v for k, v in state.items()}
+                target = getattr(self.model, "_orig_mod", self.model)
+                target.load_state_dict(state)
+            except RuntimeError as e:
+                # Architecture mismatch (e.g. a checkpoint from an older
+                # layout): better to report no model than to serve
+                # half-loaded or random weights
+                logger.warning(f"Ignoring incompatible TFT checkpoint {self.model_path}: {e}")
+                return False
             import joblib
             self.scaler = joblib.load(self.scaler_path)
+            self._freeze_scaler_stats()
             logger.info("TFT Model Loaded successfully.")
             return True
         return False
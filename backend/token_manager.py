@@ -1,26 +1,83 @@
-import json
+import atexit
+import orjson
 import os
+from collections import defaultdict
 from typing import Dict
 from datetime import datetime
 
+
+def _model_entry() -> Dict:
+    return {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "total_tokens": 0,
+        "requests": 0
+    }
+
+
 class TokenManager:
     """
     Manages tracking of AI token usage and persists it to a JSON file.
     """
+    # Rewrite the aggregate snapshot only every N calls; the per-call
+    # record goes to the append-only event log instead
+    SNAPSHOT_EVERY = 100
+
     def __init__(self, storage_file="token_usage.json"):
         self.storage_file = storage_file
+        self.event_log = os.path.splitext(storage_file)[0] + ".log"
         self.usage_data = self._load_usage()
+        self._calls_since_save = 0
+        atexit.register(self._save_usage)
 
     def _load_usage(self) -> Dict:
         """Loads usage data from the JSON file."""
+        data = None
         if os.path.exists(self.storage_file):
             try:
-                with open(self.storage_file, 'r') as f:
-                    return json.load(f)
+                # One read + parse; the snapshot holds only per-model
+                # aggregates, so it stays small regardless of history
+                with open(self.storage_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+                data["models"] = defaultdict(_model_entry, data.get("models", {}))
             except Exception as e:
                 print(f"Error loading token usage: {e}")
-                return self._init_usage_structure()
-        return self._init_usage_structure()
+                data = None
+        if data is None:
+            data = self._init_usage_structure()
+        # Fold in events written after the snapshot — an unclean shutdown
+        # can leave up to SNAPSHOT_EVERY - 1 calls only in the log
+        self._replay_log(data, int(data.get("log_offset", 0)))
+        return data
+
+    def _replay_log(self, data: Dict, offset: int):
+        """Replays event-log entries the snapshot does not yet cover."""
+        try:
+            if not os.path.exists(self.event_log):
+                return
+            if os.path.getsize(self.event_log) <= offset:
+                return
+            with open(self.event_log, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    try:
+                        ev = orjson.loads(line)
+                    except Exception:
+                        continue  # torn final line from a crash mid-write
+                    total = ev["in"] + ev["out"]
+                    data["total_input_tokens"] += ev["in"]
+                    data["total_output_tokens"] += ev["out"]
+                    data["total_tokens"] += total
+                    data["total_requests"] += 1
+                    if ev.get("ts"):
+                        data["last_updated"] = ev["ts"]
+                    m = data["models"][ev["model"]]
+                    m["input_tokens"] += ev["in"]
+                    m["output_tokens"] += ev["out"]
+                    m["total_tokens"] += total
+                    m["requests"] += 1
+        except Exception as e:
+            print(f"Error replaying token usage log: {e}")
 
     def _init_usage_structure(self) -> Dict:
         """Initializes an empty usage structure."""
@@ -29,42 +86,61 @@ class TokenManager:
             "total_input_tokens": 0,
             "total_output_tokens": 0,
             "total_requests": 0,
-            "models": {},
-            "last_updated": None
+            "models": defaultdict(_model_entry),
+            "last_updated": None,
+            "log_offset": 0
         }
 
     def add_usage(self, model_name: str, input_tokens: int, output_tokens: int):
         """
         Records token usage for a specific model call.
         """
-        # Update Global Totals
-        self.usage_data["total_input_tokens"] += input_tokens
-        self.usage_data["total_output_tokens"] += output_tokens
-        self.usage_data["total_tokens"] += (input_tokens + output_tokens)
-        self.usage_data["total_requests"] += 1
-        self.usage_data["last_updated"] = datetime.now().isoformat()
+        total = input_tokens + output_tokens
+
+        # Update Global Totals (one dict binding, local increments)
+        u = self.usage_data
+        u["total_input_tokens"] += input_tokens
+        u["total_output_tokens"] += output_tokens
+        u["total_tokens"] += total
+        u["total_requests"] += 1
+        u["last_updated"] = datetime.now().isoformat()
+
+        # Update Model-Specific Stats (defaultdict creates new entries)
+        m = u["models"][model_name]
+        m["input_tokens"] += input_tokens
+        m["output_tokens"] += output_tokens
+        m["total_tokens"] += total
+        m["requests"] += 1
 
-        # Update Model-Specific Stats
-        if model_name not in self.usage_data["models"]:
-            self.usage_data["models"][model_name] = {
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "total_tokens": 0,
-                "requests": 0
-            }
-        
-        self.usage_data["models"][model_name]["input_tokens"] += input_tokens
-        self.usage_data["models"][model_name]["output_tokens"] += output_tokens
-        self.usage_data["models"][model_name]["total_tokens"] += (input_tokens + output_tokens)
-        self.usage_data["models"][model_name]["requests"] += 1
+        self._append_event(model_name, input_tokens, output_tokens)
+        self._calls_since_save += 1
+        if self._calls_since_save >= self.SNAPSHOT_EVERY:
+            self._save_usage()
 
-        self._save_usage()
+    def _append_event(self, model_name: str, input_tokens: int, output_tokens: int):
+        """Appends one compact NDJSON line to the event log."""
+        try:
+            with open(self.event_log, 'ab') as f:
+                f.write(orjson.dumps({
+                    "ts": self.usage_data["last_updated"],
+                    "model": model_name,
+                    "in": input_tokens,
+                    "out": output_tokens
+                }) + b"\n")
+        except Exception as e:
+            print(f"Error appending token usage event: {e}")
 
     def _save_usage(self):
-        """Persists usage data to the JSON file."""
+        """Persists the aggregated snapshot to the JSON file."""
         try:
-            with open(self.storage_file, 'w') as f:
-                json.dump(self.usage_data, f, indent=4)
+            # Record how much of the event log this snapshot covers so a
+            # later load only replays the uncovered tail
+            self.usage_data["log_offset"] = (
+                os.path.getsize(self.event_log) if os.path.exists(self.event_log) else 0
+            )
+            with open(self.storage_file, 'wb') as f:
+                f.write(orjson.dumps(self.usage_data, option=orjson.OPT_INDENT_2))
+            self._calls_since_save = 0
         except Exception as e:
             print(f"Error saving token usage: {e}")
 
@@ -37,7 +37,7 @@ def train_rl_optimizer():
     dp = DataPipeline(interval="1m") # RL needs granular steps to optimize timing
     if dp.run_full_pipeline():
         me = ModelEngine()
-        agent = RLTradingAgent(dp.train_data, me.features)
+        agent = RLTradingAgent(dp.train_data, me.features, n_envs=8)
         agent.train(total_timesteps=10000)
         agent.save_model()
         logger.info("RL Sniper Training Complete.")
@@ -17,10 +17,15 @@ payload = {
     "angel_password": creds['mpin']
 }
 
+# Shared keep-alive session: amortizes the TCP/TLS handshake if this
+# grows into a sync loop, and keeps auth headers in one place
+session = requests.Session()
+session.headers.update({"Authorization": f"Bearer {TOKEN}"})
+session.mount(API_URL, requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
 print(f"Updating settings at {API_URL}...")
 try:
-    headers = {"Authorization": f"Bearer {TOKEN}"}
-    res = requests.post(f"{API_URL}/api/settings/update", json=payload, headers=headers)
+    res = session.post(f"{API_URL}/api/settings/update", json=payload, timeout=(3, 10))
     print(f"Status Code: {res.status_code}")
     print(f"Response: {res.text}")
 except Exception as e: